@@ -0,0 +1,62 @@
+"""Markdown rendering for ParityReport objects.
+
+Shared by every module that turns a ParityReport into Markdown so the
+summary table and gap sections are defined in exactly one place.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import List, TextIO
+
+from models.feature import FeatureComparison, ParityReport
+
+# Maximum number of gap IDs listed per cloud pair (keeps reports readable)
+MAX_GAPS_PER_CLOUD = 50
+
+
+def render_report(report: ParityReport, buf: TextIO) -> None:
+    """Write the full Markdown parity report into `buf`."""
+    comparisons = [comp for _, comp in sorted(report.comparisons.items())]
+
+    buf.write("# Azure Cloud Feature Parity Report\n\n")
+    buf.write(f"**Generated:** {report.generated_at.strftime('%Y-%m-%d %H:%M UTC')}  \n")
+    buf.write(f"**Total features tracked:** {report.total_features}\n\n")
+    buf.write("---\n\n")
+
+    _render_summary_table(comparisons, buf)
+
+    buf.write("\n---\n\n## Detailed Gaps by Cloud\n\n")
+
+    _render_gap_sections(comparisons, buf)
+
+
+def _render_summary_table(comparisons: List[FeatureComparison], buf: TextIO) -> None:
+    buf.write("## Parity Summary by Cloud\n\n")
+    buf.write("| Cloud | Parity % | GA in Both | Preview | Not Available |\n")
+    buf.write("|-------|----------|------------|---------|---------------|\n")
+    for comp in comparisons:
+        buf.write(
+            f"| {comp.target_cloud.value} "
+            f"| {comp.parity_percentage}% "
+            f"| {len(comp.ga_in_both)} "
+            f"| {len(comp.preview_in_target)} "
+            f"| {len(comp.not_available_in_target)} |\n"
+        )
+
+
+def _render_gap_sections(comparisons: List[FeatureComparison], buf: TextIO) -> None:
+    for comp in comparisons:
+        if not comp.not_available_in_target:
+            continue
+        buf.write(f"### {comp.baseline_cloud.value} → {comp.target_cloud.value} gaps\n\n")
+        buf.write(
+            f"Features GA in **{comp.baseline_cloud.value}** but **not available** "
+            f"in **{comp.target_cloud.value}**:\n\n"
+        )
+        # Alphabetically-first N gaps, without sorting the whole list
+        for fid in heapq.nsmallest(MAX_GAPS_PER_CLOUD, comp.not_available_in_target):
+            buf.write(f"- `{fid}`\n")
+        if len(comp.not_available_in_target) > MAX_GAPS_PER_CLOUD:
+            buf.write(f"- *… and {len(comp.not_available_in_target) - MAX_GAPS_PER_CLOUD} more*\n")
+        buf.write("\n")
@@ -44,10 +44,13 @@ class ComparisonAgent:
         logger.info(f"ComparisonAgent: comparing {len(records)} features against baseline={baseline.value}")
         comparisons: Dict[str, FeatureComparison] = {}
 
+        # Only features GA in the baseline are tracked – filter them once, not per target
+        baseline_ga = [r for r in records if r.get_status(baseline) == FeatureStatus.GA]
+
         target_clouds = [env for env in CloudEnvironment if env != baseline]
         for target in target_clouds:
             key = f"{baseline.value}_{target.value}"
-            comparisons[key] = self._compare(records, baseline, target)
+            comparisons[key] = self._compare(baseline_ga, baseline, target)
 
         report = ParityReport(
             generated_at=datetime.utcnow(),
@@ -61,22 +64,19 @@ class ComparisonAgent:
 
     def _compare(
         self,
-        records: List[FeatureRecord],
+        baseline_ga: List[FeatureRecord],
         baseline: CloudEnvironment,
         target: CloudEnvironment,
     ) -> FeatureComparison:
+        """Classify `target` status for records already known to be GA in `baseline`."""
         comparison = FeatureComparison(
             baseline_cloud=baseline,
             target_cloud=target,
         )
 
-        for record in records:
-            b_status = record.get_status(baseline)
+        for record in baseline_ga:
             t_status = record.get_status(target)
 
-            if b_status != FeatureStatus.GA:
-                continue  # only track features that are GA in baseline
-
             if t_status == FeatureStatus.GA:
                 comparison.ga_in_both.append(record.id)
             elif t_status == FeatureStatus.PREVIEW:
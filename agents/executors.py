@@ -13,7 +13,9 @@ Pipeline:
 # NOTE: Do NOT add `from __future__ import annotations` – it breaks the
 # agent_framework handler decorator's runtime type checks.
 
+import asyncio
 import re
+import time
 from typing import Optional
 from uuid import uuid4
 
@@ -47,6 +49,11 @@ KEY_FEATURE_RECORDS = "feature_records"
 KEY_REPORT = "report"
 KEY_MARKDOWN = "markdown_report"
 
+# Streamed LLM text is forwarded once this many chars are buffered or this
+# many seconds have passed since the last forwarded delta.
+_STREAM_FLUSH_CHARS = 512
+_STREAM_FLUSH_SECS = 0.1
+
 
 # ---------------------------------------------------------------------------
 # 1. Starter executor – parses the user message and seeds shared state
@@ -71,9 +78,14 @@ class ParityStarterExecutor(Executor):
             if hasattr(part, "text")
         ).strip() or "Run full parity analysis"
 
+        # Reset every per-run key so nothing leaks from a previous request
+        # when the workflow instance is reused.
         await ctx.set_shared_state(KEY_QUERY, user_text)
         await ctx.set_shared_state(KEY_SCRAPED_PAGES, {})
         await ctx.set_shared_state(KEY_EXTRA_URLS, [])
+        await ctx.set_shared_state(KEY_FEATURE_RECORDS, [])
+        await ctx.set_shared_state(KEY_REPORT, None)
+        await ctx.set_shared_state(KEY_MARKDOWN, "")
 
         service_match = re.search(
             r"(?:for|check|analyze|scan)\s+([A-Za-z][A-Za-z0-9\s\-]+?)(?:\s+service|\s+features?|$)",
@@ -133,16 +145,6 @@ class LearnScraperExecutor(Executor):
             await ctx.send_message({})
             return
 
-        if target:
-            results = await self._agent.search(
-                f"Azure {target} government availability feature parity"
-            )
-            for r in results:
-                url = r.get("url", "")
-                if url:
-                    extra_urls.append(url)
-            await ctx.set_shared_state(KEY_EXTRA_URLS, extra_urls)
-
         await ctx.add_event(
             AgentRunUpdateEvent(
                 self.id,
@@ -153,7 +155,20 @@ class LearnScraperExecutor(Executor):
                 ),
             )
         )
-        pages = await self._agent.run()
+        if target:
+            # The targeted search only feeds the web scraper's extra URLs, so
+            # overlap its round trip with the Learn scrape instead of awaiting it first.
+            results, pages = await asyncio.gather(
+                self._agent.search(f"Azure {target} government availability feature parity"),
+                self._agent.run(),
+            )
+            for r in results:
+                url = r.get("url", "")
+                if url:
+                    extra_urls.append(url)
+            await ctx.set_shared_state(KEY_EXTRA_URLS, extra_urls)
+        else:
+            pages = await self._agent.run()
         existing: dict = await ctx.get_shared_state(KEY_SCRAPED_PAGES) or {}
         await ctx.set_shared_state(KEY_SCRAPED_PAGES, {**existing, **pages})
         logger.info(f"LearnScraperExecutor: fetched {len(pages)} pages.")
@@ -236,8 +251,7 @@ class FeatureExtractorExecutor(Executor):
         if settings.skip_scraping:
             # Streaming fast path: emit each LLM chunk as it arrives.
             # First token reaches Foundry in ~1s — well within the 30s deadline.
-            import time as _time
-            _treq = _time.time()
+            _treq = time.time()
             print(f"[REQUEST] FeatureExtractorExecutor.skip_scraping path start", flush=True)
             response_id = str(uuid4())
             await ctx.add_event(
@@ -251,24 +265,47 @@ class FeatureExtractorExecutor(Executor):
                 )
             )
             full_report: list[str] = []
-            print(f"[REQUEST] starting LLM stream call", flush=True)
-            _tfirst = None
-            async for chunk in self._agent.stream_direct_report(query):
-                if _tfirst is None:
-                    _tfirst = _time.time()
-                    print(f"[REQUEST] first LLM chunk in {_tfirst-_treq:.2f}s", flush=True)
-                full_report.append(chunk)
+
+            async def _emit(text: str) -> None:
                 await ctx.add_event(
                     AgentRunUpdateEvent(
                         self.id,
                         data=AgentRunResponseUpdate(
-                            contents=[TextContent(text=chunk)],
+                            contents=[TextContent(text=text)],
                             role=Role.ASSISTANT,
                             response_id=response_id,
                         ),
                     )
                 )
-            print(f"[REQUEST] LLM stream complete in {_time.time()-_treq:.2f}s total", flush=True)
+
+            print(f"[REQUEST] starting LLM stream call", flush=True)
+            _tfirst = None
+            pending: list[str] = []
+            pending_chars = 0
+            last_flush = 0.0
+            async for chunk in self._agent.stream_direct_report(query):
+                if _tfirst is None:
+                    _tfirst = time.time()
+                    print(f"[REQUEST] first LLM chunk in {_tfirst-_treq:.2f}s", flush=True)
+                full_report.append(chunk)
+                pending.append(chunk)
+                pending_chars += len(chunk)
+                # The first chunk goes out immediately (time-to-first-byte); after
+                # that, tokens are coalesced so each one isn't its own SSE frame.
+                now = time.monotonic()
+                if (
+                    last_flush
+                    and pending_chars < _STREAM_FLUSH_CHARS
+                    and now - last_flush < _STREAM_FLUSH_SECS
+                ):
+                    continue
+                await _emit("".join(pending))
+                pending.clear()
+                pending_chars = 0
+                last_flush = now
+            if pending:
+                await _emit("".join(pending))
+            print(f"[REQUEST] LLM stream complete in {time.time()-_treq:.2f}s total", flush=True)
             await ctx.set_shared_state(KEY_MARKDOWN, "".join(full_report))
             await ctx.set_shared_state(KEY_FEATURE_RECORDS, [])
             logger.success("FeatureExtractorExecutor: streamed direct report complete.")
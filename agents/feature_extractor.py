@@ -7,13 +7,24 @@ validates responses against the Pydantic schema.
 
 from __future__ import annotations
 
-import json
+import os
 import re
-from typing import AsyncIterator, Dict, List, Optional
+import sys
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import asyncio
 import httpx
-from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+import orjson
+from azure.core.credentials import AccessToken, TokenCredential
+from azure.identity import (
+    AzureCliCredential,
+    ChainedTokenCredential,
+    EnvironmentCredential,
+    ManagedIdentityCredential,
+    get_bearer_token_provider,
+)
 from loguru import logger
 from openai import AsyncAzureOpenAI
 
@@ -24,10 +35,38 @@ from config.settings import settings
 # Using a single instance across all agents means warm-up in main.py
 # actually primes the token cache used by the OpenAI clients here.
 # -----------------------------------------------------------------
-_AZURE_CREDENTIAL: DefaultAzureCredential | None = None
+_AZURE_CREDENTIAL: TokenCredential | None = None
 
 
-def _get_azure_credential() -> DefaultAzureCredential:
+class _TokenCachingCredential:
+    """Reuses each scope's token until it is within 5 minutes of expiry.
+
+    AzureCliCredential shells out to `az` on every get_token call, so without
+    this every caller that asks for a token pays a subprocess round trip.
+    """
+
+    _REFRESH_MARGIN_SECS = 300
+
+    def __init__(self, inner: TokenCredential) -> None:
+        self._inner = inner
+        self._tokens: Dict[tuple, AccessToken] = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        if kwargs:  # claims / tenant_id challenges must reach the real credential
+            return self._inner.get_token(*scopes, **kwargs)
+        with self._lock:
+            token = self._tokens.get(scopes)
+            if token is None or token.expires_on - time.time() < self._REFRESH_MARGIN_SECS:
+                token = self._inner.get_token(*scopes)
+                self._tokens[scopes] = token
+            return token
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+def _get_azure_credential() -> TokenCredential:
     """Return the shared credential singleton (created on first call).
 
     When running inside a Foundry-hosted container (AGENT_PROJECT_RESOURCE_ID is set),
@@ -35,21 +74,52 @@ def _get_azure_credential() -> DefaultAzureCredential:
     credential probing (it tries AzureCliCredential, AzurePowerShellCredential, etc.,
     each with subprocess timeouts of 30s+, causing every LLM request to take 90+ seconds
     before the token is finally obtained via IMDS/managed identity).
+
+    Locally, an explicit Azure CLI → environment chain replaces DefaultAzureCredential
+    so no IMDS / shared-cache / IDE probes run before `az login` is consulted.
     """
     global _AZURE_CREDENTIAL
     if _AZURE_CREDENTIAL is None:
-        import os
         if os.getenv("AGENT_PROJECT_RESOURCE_ID"):
             # Foundry container: go straight to system-assigned managed identity
-            from azure.identity import ManagedIdentityCredential
-            _AZURE_CREDENTIAL = ManagedIdentityCredential()  # type: ignore[assignment]
+            inner: TokenCredential = ManagedIdentityCredential()
             logger.info("_get_azure_credential: using ManagedIdentityCredential (container env)")
         else:
-            _AZURE_CREDENTIAL = DefaultAzureCredential()
-            logger.info("_get_azure_credential: using DefaultAzureCredential (local env)")
+            inner = ChainedTokenCredential(AzureCliCredential(), EnvironmentCredential())
+            logger.info("_get_azure_credential: using AzureCliCredential → EnvironmentCredential (local env)")
+        _AZURE_CREDENTIAL = _TokenCachingCredential(inner)
     return _AZURE_CREDENTIAL
 
 
+# -----------------------------------------------------------------
+# Module-level HTTP client for Azure OpenAI
+# Every AsyncAzureOpenAI client (extractor + report generator) talks to
+# the same endpoint, so they share one keep-alive pool instead of each
+# paying its own TCP + TLS handshake.
+# -----------------------------------------------------------------
+_OPENAI_HTTP_CLIENT: httpx.AsyncClient | None = None
+
+
+def _get_openai_http_client() -> httpx.AsyncClient:
+    """Return the shared Azure OpenAI HTTP client (created on first call).
+
+    Generous read timeout: managed identity token acquisition in Container Apps
+    can be slow on first request (IMDS + token cache miss = 5-30s), so reads get
+    90s and connects 20s.  Writes are small JSON bodies and a pool wait means the
+    pool is exhausted, so those fail fast instead of hiding inside the 90s.
+    """
+    global _OPENAI_HTTP_CLIENT
+    if _OPENAI_HTTP_CLIENT is None or _OPENAI_HTTP_CLIENT.is_closed:
+        _OPENAI_HTTP_CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(connect=20.0, read=90.0, write=20.0, pool=5.0),
+            limits=httpx.Limits(
+                max_connections=20, max_keepalive_connections=10, keepalive_expiry=60
+            ),
+        )
+    return _OPENAI_HTTP_CLIENT
+
+
 async def warm_feature_extractor_credential() -> None:
     """Pre-fetch the managed-identity token so the first OpenAI request is instant.
 
@@ -63,13 +133,25 @@ async def warm_feature_extractor_credential() -> None:
     try:
         cred = _get_azure_credential()
         # get_token is synchronous — run in thread pool so we don't block the event loop
-        token = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: cred.get_token("https://cognitiveservices.azure.com/.default"),
-        )
+        token = await asyncio.to_thread(cred.get_token, "https://cognitiveservices.azure.com/.default")
         logger.info(f"warm_feature_extractor_credential: token acquired (expires {token.expires_on}).")
     except Exception as exc:
         logger.warning(f"warm_feature_extractor_credential: failed (will retry on first request): {exc}")
+
+
+async def warm_openai_connection() -> None:
+    """Open a pooled connection to the Azure OpenAI endpoint before the first request.
+
+    A bare HEAD needs no token – any response (even 401/404) leaves a warm
+    TCP + TLS connection in the shared client for the first LLM call to reuse.
+    """
+    if not settings.azure_openai_endpoint:
+        return
+    try:
+        await _get_openai_http_client().head(settings.azure_openai_endpoint, timeout=2.0)
+        logger.info("warm_openai_connection: connection to Azure OpenAI is warm.")
+    except httpx.HTTPError as exc:
+        logger.info(f"warm_openai_connection: skipped ({exc!r})")
 from models.feature import CloudEnvironment, FeatureRecord, FeatureStatus
 from utils.helpers import build_feature_id, parse_status_string
 
@@ -85,6 +167,10 @@ URL_CLOUD_HINTS: Dict[str, List[CloudEnvironment]] = {
     "china": [CloudEnvironment.CHINA],
 }
 
+# Markdown code fences the LLM sometimes wraps its JSON output in
+_CODE_FENCE_RE = re.compile(r"```(?:json)?")
+_VALID_STATUSES = frozenset(status.value for status in FeatureStatus)
+
 EXTRACTION_SYSTEM_PROMPT = """\
 You are an expert at extracting structured feature availability data from Azure cloud documentation.
 
@@ -149,14 +235,11 @@ class FeatureExtractorAgent:
                     _get_azure_credential(), "https://cognitiveservices.azure.com/.default"
                 )
                 client_kwargs["azure_ad_token_provider"] = token_provider
-            # Generous timeout: managed identity token acquisition in Container Apps can
-            # be slow on first request (IMDS + token cache miss = 5-30s).  Using 90s
-            # total / 20s connect gives the container enough headroom.
+            # Shared keep-alive pool with per-phase timeouts (see
+            # _get_openai_http_client).
             # max_retries=0 so we see the real error immediately rather than retrying
             # 3× (3 × 30s = 90s) which causes the mysterious 103s latency.
-            client_kwargs["http_client"] = httpx.AsyncClient(
-                timeout=httpx.Timeout(90.0, connect=20.0)
-            )
+            client_kwargs["http_client"] = _get_openai_http_client()
             client_kwargs["max_retries"] = 0
             self._llm = AsyncAzureOpenAI(**client_kwargs)       # gpt-4o  – deep knowledge tasks
             self._fast_llm = AsyncAzureOpenAI(**client_kwargs)  # gpt-4o-mini – speed tasks
@@ -240,13 +323,11 @@ Return ONLY Markdown. Be concise — aim for ~600 tokens total.
             yield "No LLM configured. Please check AZURE_OPENAI_ENDPOINT."
             return
 
-        import time as _t
-        import sys as _sys
-        _t0 = _t.time()
+        _t0 = time.time()
         def _diag(msg: str) -> None:
-            line = f"[LLM {_t.time()-_t0:.2f}s] {msg}\n"
-            _sys.stdout.write(line); _sys.stdout.flush()
-            _sys.stderr.write(line); _sys.stderr.flush()
+            line = f"[LLM {time.time()-_t0:.2f}s] {msg}\n"
+            sys.stdout.write(line); sys.stdout.flush()
+            sys.stderr.write(line); sys.stderr.flush()
 
         _diag(f"stream_direct_report start query={query[:60]!r}")
         logger.info(f"FeatureExtractorAgent: streaming direct report for query='{query}'")
@@ -312,28 +393,39 @@ Return ONLY Markdown. Be concise — aim for ~600 tokens total.
         """Parse and validate the LLM JSON output into FeatureRecord objects."""
         try:
             # Strip markdown code fences if present
-            raw_json = re.sub(r"```(?:json)?", "", raw_json).strip()
-            items = json.loads(raw_json)
-            records: List[FeatureRecord] = []
-            for item in items:
-                item["id"] = build_feature_id(item.get("service_name", ""), item.get("feature_name", ""))
-                item.setdefault("source_url", source_url)
-                # Normalise status strings
-                raw_status = item.get("status", {})
-                item["status"] = {
-                    env: (
-                        raw_status.get(env.value, FeatureStatus.UNKNOWN)
-                        if isinstance(raw_status.get(env.value), str)
-                        and raw_status.get(env.value) in FeatureStatus.__members__.values()
-                        else FeatureStatus.UNKNOWN
-                    )
-                    for env in CloudEnvironment
-                }
-                records.append(FeatureRecord(**item))
-            return records
+            if "```" in raw_json:
+                raw_json = _CODE_FENCE_RE.sub("", raw_json).strip()
+            items = orjson.loads(raw_json)
         except Exception as exc:
             logger.warning(f"Failed to parse LLM response: {exc}")
             return []
+        if not isinstance(items, list):
+            logger.warning(f"Failed to parse LLM response: expected a JSON array, got {type(items).__name__}")
+            return []
+        records = [self._build_record(item, source_url) for item in items]
+        return [record for record in records if record is not None]
+
+    @staticmethod
+    def _build_record(item: dict, source_url: str) -> Optional[FeatureRecord]:
+        """Normalise one LLM item into a FeatureRecord; returns None if it is invalid."""
+        try:
+            item["id"] = build_feature_id(item.get("service_name", ""), item.get("feature_name", ""))
+            item.setdefault("source_url", source_url)
+            # Normalise status strings
+            raw_status = item.get("status") or {}
+            item["status"] = {
+                env: (
+                    raw_status[env.value]
+                    if isinstance(raw_status.get(env.value), str)
+                    and raw_status[env.value] in _VALID_STATUSES
+                    else FeatureStatus.UNKNOWN
+                )
+                for env in CloudEnvironment
+            }
+            return FeatureRecord(**item)
+        except Exception as exc:
+            logger.debug(f"Skipping invalid LLM feature record: {exc}")
+            return None
 
     # ── Heuristic extraction ──────────────────────────────────────────────────
 
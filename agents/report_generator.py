@@ -6,6 +6,8 @@ optionally using an LLM to generate a natural-language executive summary.
 
 from __future__ import annotations
 
+import asyncio
+import io
 from pathlib import Path
 from typing import Optional
 
@@ -13,7 +15,8 @@ from azure.identity import get_bearer_token_provider
 from loguru import logger
 from openai import AsyncAzureOpenAI
 
-from agents.feature_extractor import _get_azure_credential
+from agents._markdown import render_report
+from agents.feature_extractor import _get_azure_credential, _get_openai_http_client
 from config.settings import settings
 from models.feature import CloudEnvironment, FeatureComparison, ParityReport
 from storage.feature_store import FeatureStore
@@ -50,6 +53,8 @@ class ReportGeneratorAgent:
                     _get_azure_credential(), "https://cognitiveservices.azure.com/.default"
                 )
                 client_kwargs["azure_ad_token_provider"] = token_provider
+            # Reuse the extractor's keep-alive pool to the same endpoint
+            client_kwargs["http_client"] = _get_openai_http_client()
             # Summary is a formatting/prose task — gpt-4o-mini is fast enough
             self._llm = AsyncAzureOpenAI(**client_kwargs)
 
@@ -67,54 +72,18 @@ class ReportGeneratorAgent:
         # Persist the updated report
         path = self._store.save_report(report)
         md_path = path.with_suffix(".md")
-        md_path.write_text(md, encoding="utf-8")
+        # Encode once and hand the single buffer to a worker thread so a large
+        # report write doesn't stall the event loop.
+        await asyncio.to_thread(md_path.write_bytes, md.encode("utf-8"))
         logger.success(f"ReportGeneratorAgent: report written to {md_path}")
         return md
 
     # ── Markdown builder ──────────────────────────────────────────────────────
 
     def _build_markdown(self, report: ParityReport) -> str:
-        lines = [
-            f"# Azure Cloud Feature Parity Report",
-            f"",
-            f"**Generated:** {report.generated_at.strftime('%Y-%m-%d %H:%M UTC')}  ",
-            f"**Total features tracked:** {report.total_features}",
-            f"",
-            f"---",
-            f"",
-            f"## Parity Summary by Cloud",
-            f"",
-            f"| Cloud | Parity % | GA in Both | Preview | Not Available |",
-            f"|-------|----------|------------|---------|---------------|",
-        ]
-
-        for key, comp in sorted(report.comparisons.items()):
-            lines.append(
-                f"| {comp.target_cloud.value} "
-                f"| {comp.parity_percentage}% "
-                f"| {len(comp.ga_in_both)} "
-                f"| {len(comp.preview_in_target)} "
-                f"| {len(comp.not_available_in_target)} |"
-            )
-
-        lines += ["", "---", "", "## Detailed Gaps by Cloud", ""]
-
-        for key, comp in sorted(report.comparisons.items()):
-            if not comp.not_available_in_target:
-                continue
-            lines += [
-                f"### {comp.baseline_cloud.value} → {comp.target_cloud.value} gaps",
-                f"",
-                f"Features GA in **{comp.baseline_cloud.value}** but **not available** in **{comp.target_cloud.value}**:",
-                f"",
-            ]
-            for fid in sorted(comp.not_available_in_target[:50]):  # cap at 50 for readability
-                lines.append(f"- `{fid}`")
-            if len(comp.not_available_in_target) > 50:
-                lines.append(f"- *… and {len(comp.not_available_in_target) - 50} more*")
-            lines.append("")
-
-        return "\n".join(lines)
+        buf = io.StringIO()
+        render_report(report, buf)
+        return buf.getvalue()
 
     # ── LLM summary ───────────────────────────────────────────────────────────
 
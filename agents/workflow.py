@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from agent_framework import WorkflowBuilder, WorkflowAgent, Workflow
 
 from agents.executors import (
@@ -12,16 +14,46 @@ from agents.executors import (
     ReportExecutor,
     WebScraperExecutor,
 )
-from agents.workflow_state import ParityWorkflowState
+from clients._http import warmup
+from config.settings import settings
 from storage.feature_store import FeatureStore
 
 
+# Process-wide workflow singleton – executors only hold stateless agents and a
+# shared FeatureStore, and per-run data lives in workflow shared state (reset by
+# ParityStarterExecutor), so one graph can serve every request.
+_WORKFLOW: Workflow | None = None
+# Held so the background connection warm-up isn't garbage-collected mid-flight
+_WARMUP_TASK: asyncio.Task | None = None
+
+
 def build_parity_workflow() -> Workflow:
     """
-    Factory that returns a fresh Workflow each call.
+    Return the shared Workflow, constructing it on first call.
     Called by build_parity_agent() which wraps the result with .as_agent().
     Also used directly in CLI mode for lightweight testing.
     """
+    global _WORKFLOW
+    if _WORKFLOW is None:
+        _WORKFLOW = _construct_workflow()
+        _schedule_http_warmup()
+    return _WORKFLOW
+
+
+def _schedule_http_warmup() -> None:
+    """Pre-connect to the scraped hosts in the background while startup continues."""
+    global _WARMUP_TASK
+    if settings.skip_scraping:
+        return  # outbound internet is blocked – nothing to warm
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # built outside an event loop; the first scrape connects normally
+    _WARMUP_TASK = loop.create_task(warmup())
+
+
+def _construct_workflow() -> Workflow:
+    """Build a fresh FeatureStore + executor chain."""
     store = FeatureStore()
 
     starter = ParityStarterExecutor()
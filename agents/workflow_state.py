@@ -8,7 +8,7 @@ from typing import Dict, List, Optional
 from models.feature import FeatureRecord, ParityReport
 
 
-@dataclass
+@dataclass(slots=True)
 class ParityWorkflowState:
     """Mutable state carried through every executor in the parity pipeline."""
 
@@ -17,7 +17,7 @@ class ParityWorkflowState:
     target_service: Optional[str] = None   # None = full scan, else targeted run
     extra_urls: List[str] = field(default_factory=list)
 
-    # Populated by scraper executors
+    # Populated by scraper executors: URL → HTML (main content only for Learn pages)
     scraped_pages: Dict[str, str] = field(default_factory=dict)
 
     # Populated by extractor executor
@@ -2,24 +2,44 @@
 import time
 from azure.ai.projects import AIProjectClient
 from azure.ai.projects.models import AgentReference
-from azure.identity import DefaultAzureCredential
+from azure.identity import AzureCliCredential, ChainedTokenCredential, EnvironmentCredential
 
 AGENT_VERSION = "18"  # update to match the currently deployed version
 PROJECT_ENDPOINT = "https://cloudparitybotproject-resource.services.ai.azure.com/api/projects/cloudparitybotproject"
-client = AIProjectClient(endpoint=PROJECT_ENDPOINT, credential=DefaultAzureCredential())
+# Explicit chain: skips DefaultAzureCredential's IMDS / IDE probes on a dev box
+credential = ChainedTokenCredential(AzureCliCredential(), EnvironmentCredential())
+client = AIProjectClient(endpoint=PROJECT_ENDPOINT, credential=credential)
 
 # --- test a live request ---
+# Stream the response and stop once PREVIEW_CHARS have arrived – the check only
+# needs proof of life, not the full completion.
+PREVIEW_CHARS = 300
 print(f"Sending test request to azure-cloud-parity-bot v{AGENT_VERSION} ...")
-t0 = time.time()
+t0 = time.perf_counter()
 try:
     oc = client.get_openai_client()
-    resp = oc.responses.create(
+    stream = oc.responses.create(
         input=[{"role": "user", "content": "Say hello and confirm you are the Azure Cloud Parity Bot."}],
         extra_body={"agent": AgentReference(name="azure-cloud-parity-bot", version=AGENT_VERSION).as_dict()},
         timeout=120,
+        stream=True,
     )
-    print(f"SUCCESS in {time.time() - t0:.1f}s")
-    print(resp.output_text[:300])
+    text = ""
+    t_first = None
+    try:
+        for event in stream:
+            if event.type == "response.output_text.delta":
+                if t_first is None:
+                    t_first = time.perf_counter() - t0
+                text += event.delta
+                if len(text) >= PREVIEW_CHARS:
+                    break
+    finally:
+        stream.close()
+    if t_first is None:
+        print(f"ERROR after {time.perf_counter() - t0:.1f}s: stream ended without any output text")
+    else:
+        print(f"SUCCESS in {time.perf_counter() - t0:.1f}s (first token after {t_first:.1f}s)")
+        print(text[:PREVIEW_CHARS])
 except Exception as e:
-    print(f"ERROR after {time.time() - t0:.1f}s: {type(e).__name__}: {e}")
-
+    print(f"ERROR after {time.perf_counter() - t0:.1f}s: {type(e).__name__}: {e}")
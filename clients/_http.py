@@ -0,0 +1,99 @@
+"""Process-wide shared httpx.AsyncClient.
+
+MicrosoftLearnMCPClient and WebContentClient both borrow this client instead
+of opening their own, so repeated workflow runs reuse warm TCP/TLS (and HTTP/2)
+connections to learn.microsoft.com and azure.microsoft.com.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from config.settings import settings
+
+_SHARED_CLIENT: Optional[httpx.AsyncClient] = None
+
+# Hosts every scrape contacts – pre-connected by warmup()
+KNOWN_HOSTS = (
+    "https://learn.microsoft.com/",
+    "https://azure.microsoft.com/",
+)
+
+# URL → future for fetches currently in flight (single-flight dedup)
+_INFLIGHT: Dict[str, "asyncio.Future[str]"] = {}
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient (created on first call).
+
+    Per-client headers and timeouts are passed on each request, so only
+    transport-level options are configured here.
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=settings.scrape_timeout_seconds,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=300,
+            ),
+        )
+    return _SHARED_CLIENT
+
+
+async def close_shared_client() -> None:
+    """Close the shared AsyncClient, if one was created (call once at shutdown)."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
+
+
+async def warmup() -> None:
+    """Resolve DNS and open TLS connections to KNOWN_HOSTS so the first scrape finds them warm."""
+    client = get_shared_client()
+    await asyncio.gather(*[client.head(url) for url in KNOWN_HOSTS], return_exceptions=True)
+
+
+async def fetch_once(url: str, do_fetch: Callable[[], Awaitable[str]]) -> str:
+    """Run `do_fetch` for `url` unless a fetch for the same URL is already in flight.
+
+    Concurrent callers – from either scraping client – await the first caller's
+    result instead of issuing duplicate requests. If the first caller is
+    cancelled, its waiters are not: they retry the fetch themselves.
+    """
+    pending = _INFLIGHT.get(url)
+    if pending is not None:
+        try:
+            # shield: a cancelled waiter must not cancel the shared fetch
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            # Only propagate if *this* task was cancelled, not just the owner's fetch
+            if not pending.cancelled() or asyncio.current_task().cancelling():
+                raise
+        return await fetch_once(url, do_fetch)
+
+    future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+    # Mark any exception as retrieved so an un-awaited future doesn't log a warning
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    _INFLIGHT[url] = future
+    try:
+        text = await do_fetch()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(text)
+        return text
+    finally:
+        if _INFLIGHT.get(url) is future:
+            del _INFLIGHT[url]
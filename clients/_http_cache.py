@@ -0,0 +1,104 @@
+"""On-disk HTTP response cache used for conditional GETs.
+
+Stores the body plus ETag / Last-Modified validators for each URL so a warm
+run can revalidate with If-None-Match / If-Modified-Since and reuse the cached
+body on a 304 instead of downloading the page again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import httpx
+from loguru import logger
+from pydantic import BaseModel
+
+
+class CacheEntry(BaseModel):
+    """A cached response body and its validators."""
+
+    url: str
+    text: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DiskCache:
+    """
+    File-backed cache of HTTP responses – one JSON file per URL.
+
+    Entries older than `ttl` seconds are ignored so that pages are fully
+    re-downloaded at least that often, even if the server keeps answering 304.
+    """
+
+    def __init__(self, cache_dir: Path, ttl: int) -> None:
+        self._dir = cache_dir
+        self._ttl = ttl
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path:
+        return self._dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]}.json"
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Return the cached entry for `url`, or None if missing / expired / unreadable.
+
+        Expired and unreadable entries are deleted so the cache directory does not
+        grow without bound. Blocking – call via asyncio.to_thread from async code.
+        """
+        path = self._path(url)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            entry = CacheEntry.model_validate_json(data)
+        except Exception as exc:
+            logger.debug(f"Removing unreadable cache entry {path}: {exc}")
+            self._discard(path)
+            return None
+        if entry.url != url:
+            return None
+        if time.time() - entry.fetched_at > self._ttl:
+            self._discard(path)
+            return None
+        return entry
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.debug(f"Could not remove cache entry {path}: {exc}")
+
+    def put(self, url: str, response: httpx.Response) -> None:
+        """Cache a successful response if it carries an ETag or Last-Modified validator.
+
+        Blocking – call via asyncio.to_thread from async code.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        entry = CacheEntry(
+            url=url,
+            text=response.text,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.time(),
+        )
+        try:
+            self._path(url).write_text(entry.model_dump_json(), encoding="utf-8")
+        except OSError as exc:
+            logger.debug(f"Could not write HTTP cache entry for {url}: {exc}")
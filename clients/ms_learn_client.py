@@ -3,14 +3,27 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import httpx
 from loguru import logger
+from selectolax.lexbor import LexborHTMLParser
 
+from clients._http import fetch_once, get_shared_client
+from clients._http_cache import DiskCache
 from config.settings import settings
 
 
+def _extract_main(html: str) -> str:
+    """Return the HTML of the page's main content node, dropping nav/header/footer chrome.
+
+    Falls back to the full page only when no main/article/content node is found.
+    """
+    node = LexborHTMLParser(html).css_first("main, article, div.content")
+    return (node.html or html) if node is not None else html
+
+
 class MicrosoftLearnMCPClient:
     """
     Async client for fetching Azure documentation from Microsoft Learn.
@@ -27,7 +40,7 @@ class MicrosoftLearnMCPClient:
     }
 
     # Well-known parity pages on Microsoft Learn
-    GOVERNMENT_PARITY_URLS: List[str] = [
+    GOVERNMENT_PARITY_URLS: Tuple[str, ...] = (
         "https://learn.microsoft.com/en-us/azure/azure-government/documentation-government-services",
         "https://learn.microsoft.com/en-us/azure/azure-government/compare-azure-government-global-azure",
         "https://learn.microsoft.com/en-us/azure/azure-government/documentation-government-services-compute",
@@ -37,68 +50,81 @@ class MicrosoftLearnMCPClient:
         "https://learn.microsoft.com/en-us/azure/azure-government/documentation-government-services-securityandidentity",
         "https://learn.microsoft.com/en-us/azure/azure-government/documentation-government-services-aiandcognitive",
         "https://learn.microsoft.com/en-us/azure/azure-government/documentation-government-services-iot",
-    ]
+    )
 
-    CHINA_PARITY_URLS: List[str] = [
+    CHINA_PARITY_URLS: Tuple[str, ...] = (
         "https://learn.microsoft.com/en-us/azure/china/resources-developer-guide",
         "https://learn.microsoft.com/en-us/azure/china/resources-azure-china-general-faq",
-    ]
+    )
 
     # Tight timeout so a dead network fails fast (8 s per request)
     def __init__(self, timeout: int = 8) -> None:
         self._timeout = timeout
         self._client: Optional[httpx.AsyncClient] = None
+        self._sem = asyncio.BoundedSemaphore(settings.scrape_max_concurrency)
+        self._cache = DiskCache(Path(settings.http_cache_dir), ttl=settings.http_cache_ttl_seconds)
 
     async def __aenter__(self) -> "MicrosoftLearnMCPClient":
-        self._client = httpx.AsyncClient(
-            headers=self.DEFAULT_HEADERS,
-            timeout=self._timeout,
-            follow_redirects=True,
-        )
+        # Borrow the process-wide client; it stays open for the next run.
+        self._client = get_shared_client()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
-        if self._client:
-            await self._client.aclose()
+        # Nothing to release – the shared client is closed once at process shutdown.
+        return None
+
+    async def fetch_page(self, url: str, main_only: bool = True) -> str:
+        """Fetch HTML content from a Microsoft Learn URL.
 
-    async def fetch_page(self, url: str) -> str:
-        """Fetch raw HTML content from a Microsoft Learn URL."""
+        With `main_only` (the default) only the page's main content element is
+        returned, which is where Learn keeps the availability tables.
+        """
         assert self._client is not None, "Use as async context manager."
+        html = await fetch_once(url, lambda: self._fetch_page(url))
+        return _extract_main(html) if main_only and html else html
+
+    async def _fetch_page(self, url: str) -> str:
         logger.debug(f"Fetching {url}")
+        cached = await asyncio.to_thread(self._cache.get, url)
+        headers = {**self.DEFAULT_HEADERS, **(cached.conditional_headers() if cached else {})}
         try:
-            response = await self._client.get(url)
-            response.raise_for_status()
-            return response.text
-        except httpx.HTTPStatusError as exc:
-            logger.warning(f"HTTP {exc.response.status_code} fetching {url}")
-            return ""
+            response = await self._client.get(url, headers=headers, timeout=self._timeout)
         except httpx.RequestError as exc:
             logger.error(f"Request error fetching {url}: {exc}")
             return ""
+        if cached and response.status_code == 304:
+            logger.debug(f"Not modified, using cached copy of {url}")
+            return cached.text
+        if not response.is_success:
+            logger.warning(f"HTTP {response.status_code} fetching {url}")
+            return ""
+        await asyncio.to_thread(self._cache.put, url, response)
+        return response.text
+
+    async def fetch_many(self, urls: Sequence[str]) -> Dict[str, str]:
+        """Fetch URLs concurrently (bounded by scrape_max_concurrency), returning url → html."""
+
+        async def _bounded(url: str) -> str:
+            async with self._sem:
+                return await self.fetch_page(url)
 
-    async def fetch_government_parity_pages(self) -> Dict[str, str]:
-        """Fetch all Azure Government parity documentation pages concurrently."""
         htmls = await asyncio.gather(
-            *[self.fetch_page(url) for url in self.GOVERNMENT_PARITY_URLS],
+            *[_bounded(url) for url in urls],
             return_exceptions=True,
         )
         return {
             url: html
-            for url, html in zip(self.GOVERNMENT_PARITY_URLS, htmls)
+            for url, html in zip(urls, htmls)
             if isinstance(html, str) and html
         }
 
+    async def fetch_government_parity_pages(self) -> Dict[str, str]:
+        """Fetch all Azure Government parity documentation pages concurrently."""
+        return await self.fetch_many(self.GOVERNMENT_PARITY_URLS)
+
     async def fetch_china_parity_pages(self) -> Dict[str, str]:
         """Fetch Azure China parity documentation pages concurrently."""
-        htmls = await asyncio.gather(
-            *[self.fetch_page(url) for url in self.CHINA_PARITY_URLS],
-            return_exceptions=True,
-        )
-        return {
-            url: html
-            for url, html in zip(self.CHINA_PARITY_URLS, htmls)
-            if isinstance(html, str) and html
-        }
+        return await self.fetch_many(self.CHINA_PARITY_URLS)
 
     async def search_docs(self, query: str, max_results: int = 10) -> List[Dict[str, str]]:
         """
@@ -115,7 +141,9 @@ class MicrosoftLearnMCPClient:
             "category": "Documentation",
         }
         try:
-            response = await self._client.get(search_url, params=params)
+            response = await self._client.get(
+                search_url, params=params, headers=self.DEFAULT_HEADERS, timeout=self._timeout
+            )
             response.raise_for_status()
             data = response.json()
             return data.get("results", [])
@@ -3,67 +3,118 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import random
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
 from urllib.parse import urljoin, urlparse
 
 import httpx
 from loguru import logger
 
+from clients._http import fetch_once, get_shared_client
+from clients._http_cache import DiskCache
 from config.settings import settings
 
 
+@lru_cache(maxsize=256)
+def _host_of(url: str) -> str:
+    """netloc of `url`, memoised – the same handful of URLs is fetched every run."""
+    return urlparse(url).netloc
+
+
 class WebContentClient:
     """Async HTTP client for fetching content from arbitrary public URLs."""
 
     AZURE_UPDATES_URL = "https://azure.microsoft.com/en-us/updates/"
-    SOVEREIGN_DOCS_URLS: List[str] = [
+    SOVEREIGN_DOCS_URLS: Tuple[str, ...] = (
         "https://azure.microsoft.com/en-us/explore/global-infrastructure/government/",
         "https://azure.microsoft.com/en-us/explore/global-infrastructure/sovereign-clouds/",
-    ]
+    )
 
     DEFAULT_HEADERS = {
         "User-Agent": "azure-cloud-parity-bot/1.0",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
 
+    _HOST_CONCURRENCY = 4
+    _MAX_BACKOFF_SECS = 30.0
+
     # Tight timeout so a dead network fails fast (8 s per request)
     def __init__(self, timeout: int = 8) -> None:
         self._timeout = timeout
         self._client: Optional[httpx.AsyncClient] = None
+        self._sem = asyncio.BoundedSemaphore(settings.scrape_max_concurrency)
+        # Per-host politeness: at most _HOST_CONCURRENCY in-flight requests per netloc
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._cache = DiskCache(Path(settings.http_cache_dir), ttl=settings.http_cache_ttl_seconds)
 
     async def __aenter__(self) -> "WebContentClient":
-        self._client = httpx.AsyncClient(
-            headers=self.DEFAULT_HEADERS,
-            timeout=self._timeout,
-            follow_redirects=True,
-        )
+        # Borrow the process-wide client; it stays open for the next run.
+        self._client = get_shared_client()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
-        if self._client:
-            await self._client.aclose()
+        # Nothing to release – the shared client is closed once at process shutdown.
+        return None
+
+    def _sem_for(self, url: str) -> asyncio.Semaphore:
+        """Return the (lazily created) semaphore limiting requests to this URL's host."""
+        host = _host_of(url)
+        sem = self._host_sems.get(host)
+        if sem is None:
+            sem = self._host_sems[host] = asyncio.Semaphore(self._HOST_CONCURRENCY)
+        return sem
+
+    def _backoff(self, attempt: int) -> float:
+        """Jittered exponential backoff delay before retry `attempt + 1`."""
+        delay = min(self._MAX_BACKOFF_SECS, settings.scrape_delay_seconds * 2 ** (attempt - 1))
+        return delay * random.uniform(0.5, 1.5)
 
     async def fetch(self, url: str) -> str:
         """Fetch raw HTML from any URL."""
         assert self._client is not None, "Use as async context manager."
+        return await fetch_once(url, lambda: self._fetch(url))
+
+    async def _fetch(self, url: str) -> str:
+        cached = await asyncio.to_thread(self._cache.get, url)
+        headers = {**self.DEFAULT_HEADERS, **(cached.conditional_headers() if cached else {})}
+        loop = asyncio.get_running_loop()
         for attempt in range(1, settings.scrape_max_retries + 1):
+            started = loop.time()
             try:
-                response = await self._client.get(url)
-                response.raise_for_status()
-                return response.text
-            except httpx.HTTPStatusError as exc:
-                logger.warning(f"[attempt {attempt}] HTTP {exc.response.status_code} for {url}")
-                if exc.response.status_code in {401, 403, 404}:
-                    break
+                async with self._sem_for(url):
+                    response = await self._client.get(url, headers=headers, timeout=self._timeout)
             except httpx.RequestError as exc:
                 logger.warning(f"[attempt {attempt}] Request error for {url}: {exc}")
-            await asyncio.sleep(attempt * settings.scrape_delay_seconds)
+            else:
+                if cached and response.status_code == 304:
+                    logger.debug(f"Not modified, using cached copy of {url}")
+                    return cached.text
+                if response.is_success:
+                    await asyncio.to_thread(self._cache.put, url, response)
+                    return response.text
+                logger.warning(f"[attempt {attempt}] HTTP {response.status_code} for {url}")
+                if response.status_code in {401, 403, 404}:
+                    break
+            if attempt < settings.scrape_max_retries:
+                # The backoff is measured from the start of the failed attempt, so a
+                # slow failure (e.g. a timeout) has already paid for some or all of
+                # it. Sleep outside the host semaphore so other requests can proceed.
+                remaining = self._backoff(attempt) - (loop.time() - started)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
         return ""
 
-    async def fetch_many(self, urls: List[str]) -> Dict[str, str]:
-        """Fetch multiple URLs concurrently, returning a map of url → html."""
+    async def fetch_many(self, urls: Sequence[str]) -> Dict[str, str]:
+        """Fetch multiple URLs concurrently (bounded by scrape_max_concurrency), returning url → html."""
+
+        async def _bounded(url: str) -> str:
+            async with self._sem:
+                return await self.fetch(url)
+
         htmls = await asyncio.gather(
-            *[self.fetch(url) for url in urls],
+            *[_bounded(url) for url in urls],
             return_exceptions=True,
         )
         return {
@@ -47,6 +47,8 @@ class Settings(BaseSettings):
     scrape_timeout_seconds: int = Field(default=30)
     scrape_max_retries: int = Field(default=3)
     scrape_delay_seconds: float = Field(default=1.0)
+    # Upper bound on concurrent page fetches per client (semaphore + connection pool)
+    scrape_max_concurrency: int = Field(default=5)
     # Set SKIP_SCRAPING=true in environments where outbound internet is
     # restricted (e.g. Foundry hosted-agent containers). The pipeline will
     # use the LLM's training knowledge instead of live web fetches.
@@ -68,6 +70,9 @@ class Settings(BaseSettings):
     # ── Storage ───────────────────────────────────────────────────────────────
     data_dir: str = Field(default="data/features")
     reports_dir: str = Field(default="reports")
+    # Conditional-GET cache for scraped pages (ETag / Last-Modified revalidation)
+    http_cache_dir: str = Field(default="data/http_cache")
+    http_cache_ttl_seconds: int = Field(default=7 * 24 * 3600)
 
     # ── Logging ───────────────────────────────────────────────────────────────
     log_level: str = Field(default="INFO")
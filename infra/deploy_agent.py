@@ -12,9 +12,18 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
 
+from hosted_agent_env import SHARED_ENV, run_profiled
+
+if TYPE_CHECKING:
+    import httpx
+    from azure.ai.projects import AIProjectClient
+
 load_dotenv(override=True)
 
 PROJECT_ENDPOINT = os.getenv(
@@ -23,9 +32,78 @@ PROJECT_ENDPOINT = os.getenv(
 )
 MODEL_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o")
 AGENT_NAME = "azure-cloud-parity-bot"
+CONTAINER_API_VERSION = "2025-11-15-preview"
+WARMUP_ATTEMPTS = 6
+WARMUP_RETRY_SECS = 10
+
+
+def _container_url(version: object, action: str) -> str:
+    """REST URL for a container action (start / stop) on an agent version."""
+    return (
+        f"{PROJECT_ENDPOINT}/agents/{AGENT_NAME}"
+        f"/versions/{version}/containers/default:{action}"
+        f"?api-version={CONTAINER_API_VERSION}"
+    )
+
 
+def _warm_agent(client: AIProjectClient, version: object) -> None:
+    """Send one small request so the new container finishes booting now.
 
-def deploy(image: str) -> None:
+    min_replicas=1 keeps a replica running, but its first request still pays
+    the Python start-up, credential and OpenAI connection warm-up inside the
+    container.  Paying it here keeps it off the first real user request.
+    """
+    from azure.ai.projects.models import AgentReference
+
+    oc = client.get_openai_client()
+    agent_ref = AgentReference(name=AGENT_NAME, version=str(version)).as_dict()
+    for attempt in range(1, WARMUP_ATTEMPTS + 1):
+        t0 = time.perf_counter()
+        try:
+            stream = oc.responses.create(
+                input=[{"role": "user", "content": "ping"}],
+                extra_body={"agent": agent_ref},
+                timeout=120,
+                stream=True,
+            )
+            try:
+                # First output proves the container is up – no need for the rest
+                for event in stream:
+                    if event.type == "response.output_text.delta":
+                        break
+            finally:
+                stream.close()
+        except Exception as exc:
+            print(f"  Warm-up attempt {attempt}/{WARMUP_ATTEMPTS} failed: {type(exc).__name__}: {exc}")
+            if attempt < WARMUP_ATTEMPTS:
+                time.sleep(WARMUP_RETRY_SECS)
+            continue
+        print(f"✅ Agent warm (answered in {time.perf_counter() - t0:.1f}s).")
+        return
+    print("⚠️  Agent did not answer the warm-up request; the first real request will pay the cold start.")
+
+
+def _stop_version(http: httpx.Client, version: int) -> None:
+    """Stop a running agent version via the REST API.
+
+    The az CLI path needed a shell=True subprocess, which on Windows silently
+    drops list args.
+    """
+    import httpx
+
+    try:
+        resp = http.post(_container_url(version, "stop"), json={})
+        if resp.is_success:
+            print(f"Stopped version {version}.")
+        else:
+            print(f"⚠️  Could not stop version {version} (may already be stopped): "
+                  f"HTTP {resp.status_code} {resp.text.strip()}")
+    except httpx.HTTPError as exc:
+        print(f"⚠️  Could not stop version {version}: {exc}")
+
+
+def deploy(image: str, warmup: bool = True) -> None:
+    import httpx
     from azure.ai.projects import AIProjectClient
     from azure.ai.projects.models import (
         AgentProtocol,
@@ -35,122 +113,113 @@ def deploy(image: str) -> None:
     from azure.identity import DefaultAzureCredential
 
     print(f"Connecting to Foundry project: {PROJECT_ENDPOINT}")
-    client = AIProjectClient(endpoint=PROJECT_ENDPOINT, credential=DefaultAzureCredential())
+    # One credential for the SDK client and the raw container calls below, so
+    # the credential chain is only probed once per deploy.
+    credential = DefaultAzureCredential()
+    client = AIProjectClient(endpoint=PROJECT_ENDPOINT, credential=credential)
+    token = credential.get_token("https://ai.azure.com/.default").token
+    # One pooled client for the stop and start calls – both hit the same host,
+    # so the second call reuses the first call's TLS connection. The pool exits
+    # first, so the client stays open until a background stop has finished.
+    with httpx.Client(
+        http2=True,
+        timeout=30,
+        headers={"Authorization": f"Bearer {token}"},
+        limits=httpx.Limits(max_keepalive_connections=8),
+    ) as http, ThreadPoolExecutor(max_workers=1) as pool:
+        # Determine next version number
+        try:
+            existing = client.agents.get(agent_name=AGENT_NAME)
+            current_version = int(existing.versions.latest.version)
+            next_version = current_version + 1
+            print(f"Existing agent found at version {current_version}. Will create version {next_version}.")
+        except Exception:
+            current_version = None
+            print("No existing agent found. Creating version 1.")
 
-    # Determine next version number
-    try:
-        existing = client.agents.get(agent_name=AGENT_NAME)
-        current_version = int(existing.versions.latest.version)
-        next_version = current_version + 1
-        print(f"Existing agent found at version {current_version}. Will create version {next_version}.")
-        # Stop the running version via the SDK (subprocess shell=True on Windows
-        # silently drops list args — the old approach never worked).
-        import subprocess
-        stop_cmd = (
-            f"az cognitiveservices agent stop"
-            f" --account-name cloudparitybotproject-resource"
-            f" --project-name cloudparitybotproject"
-            f" --name {AGENT_NAME}"
-            f" --agent-version {current_version}"
+        # Stopping the old version and registering the new one are independent –
+        # only the start call below needs the stop to have finished.
+        stop_future = (
+            pool.submit(_stop_version, http, current_version) if current_version is not None else None
         )
-        result = subprocess.run(stop_cmd, shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"Stopped version {current_version}.")
-        else:
-            print(f"⚠️  Could not stop version {current_version} (may already be stopped): {result.stderr.strip()}")
-    except Exception:
-        print("No existing agent found. Creating version 1.")
-
-    print(f"Registering agent '{AGENT_NAME}' with image: {image}")
-    agent = client.agents.create_version(
-        agent_name=AGENT_NAME,
-        description="Multi-agent pipeline that tracks and compares Azure service feature availability across Commercial, GCC, GCC-High, DoD, and China clouds.",
-        definition=ImageBasedHostedAgentDefinition(
-            container_protocol_versions=[
-                ProtocolVersionRecord(protocol=AgentProtocol.RESPONSES, version="v1")
-            ],
-            cpu="1",
-            memory="2Gi",
-            image=image,
-            environment_variables={
-                "AZURE_AI_FOUNDRY_PROJECT_ENDPOINT": PROJECT_ENDPOINT,
-                # NOTE: do NOT set AZURE_AI_PROJECT_ENDPOINT to a real value —
-                # the hosting adapter uses that env var to trigger
-                # _setup_tracing_with_azure_ai_client(), which calls
-                # DefaultAzureCredential().get_token() SYNCHRONOUSLY, blocking
-                # the asyncio event loop for 90-100 seconds.
-                # We set it to empty string so that even if Foundry injects a
-                # value, our explicit definition takes precedence and the empty
-                # string is falsy → tracing setup is skipped.
-                "AZURE_AI_PROJECT_ENDPOINT": "",
-                # Setting APPLICATIONINSIGHTS_CONNECTION_STRING to a non-empty
-                # sentinel prevents the agentserver logger from calling
-                # AIProjectClient.telemetry.get_application_insights_connection_string()
-                # (a blocking HTTPS call that can hang for 60-120 seconds).
-                # The string "skip-telemetry" is not a valid connection string,
-                # so the Application Insights exporter creation will fail
-                # harmlessly and telemetry will be disabled.
-                "APPLICATIONINSIGHTS_CONNECTION_STRING": "skip-telemetry",
-                # Use services.ai.azure.com endpoint – reachable from Foundry container networking.
-                "AZURE_OPENAI_ENDPOINT": "https://cloudparitybotproject-resource.services.ai.azure.com/",
-                "AZURE_OPENAI_DEPLOYMENT": MODEL_NAME,
-                "AZURE_OPENAI_API_VERSION": os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview"),
-                "FAST_AZURE_OPENAI_DEPLOYMENT": "gpt-4o-mini",
-                "AGENT_DEBUG_ERRORS": "true",  # expose full errors in responses
-                "SKIP_SCRAPING": "true",  # outbound internet blocked in Foundry container
-                # Required by the Agent Framework to resolve the project resource.
-                "AGENT_PROJECT_RESOURCE_ID": (
-                    "/subscriptions/0cc114af-43d6-4d8f-ba1d-cd863a819339"
-                    "/resourceGroups/Team2"
-                    "/providers/Microsoft.CognitiveServices/accounts"
-                    "/cloudparitybotproject-resource"
-                ),
-            },
-        ),
-    )
-    print(f"✅ Agent registered: {agent.name}  version={agent.version}  id={agent.id}")
 
-    print("Starting agent deployment (min_replicas=1 to prevent cold starts)...")
-    # Use REST API directly so we can pass min_replicas=1 — the az CLI does not
-    # expose this parameter and defaults to 0 (scale-to-zero), which causes the
-    # container to cold-start on every first request and time out Foundry's 30s
-    # deadline.
-    from azure.identity import DefaultAzureCredential
-    import urllib.request as _req
-    import json as _json
-
-    base = PROJECT_ENDPOINT.split("/api/projects/")[0]  # https://<resource>.services.ai.azure.com
-    project = PROJECT_ENDPOINT.split("/api/projects/")[1]  # cloudparitybotproject
-    start_url = (
-        f"{base}/api/projects/{project}/agents/{AGENT_NAME}"
-        f"/versions/{agent.version}/containers/default:start"
-        f"?api-version=2025-11-15-preview"
-    )
-    cred = DefaultAzureCredential()
-    token = cred.get_token("https://ai.azure.com/.default").token
-    body = _json.dumps({"min_replicas": 1}).encode()
-    http_req = _req.Request(
-        start_url,
-        data=body,
-        method="POST",
-        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
-    )
-    try:
-        with _req.urlopen(http_req, timeout=30) as resp_raw:
-            resp_data = _json.loads(resp_raw.read())
-        container = resp_data.get("container", {})
-        print(f"✅ Agent deployment started: status={resp_data.get('status')}  "
-              f"min_replicas={container.get('min_replicas')}  "
-              f"max_replicas={container.get('max_replicas')}")
-    except Exception as exc:
-        print(f"⚠️  Start request failed: {exc}")
-        print(f"Run manually (min_replicas=1 body):")
-        print(f"  POST {start_url}")
-        print(f'  Body: {{"min_replicas": 1}}')
+        print(f"Registering agent '{AGENT_NAME}' with image: {image}")
+        agent = client.agents.create_version(
+            agent_name=AGENT_NAME,
+            description="Multi-agent pipeline that tracks and compares Azure service feature availability across Commercial, GCC, GCC-High, DoD, and China clouds.",
+            definition=ImageBasedHostedAgentDefinition(
+                container_protocol_versions=[
+                    ProtocolVersionRecord(protocol=AgentProtocol.RESPONSES, version="v1")
+                ],
+                cpu="1",
+                memory="2Gi",
+                image=image,
+                environment_variables={
+                    **SHARED_ENV,
+                    "AZURE_AI_FOUNDRY_PROJECT_ENDPOINT": PROJECT_ENDPOINT,
+                    # NOTE: do NOT set AZURE_AI_PROJECT_ENDPOINT to a real value —
+                    # the hosting adapter uses that env var to trigger
+                    # _setup_tracing_with_azure_ai_client(), which calls
+                    # DefaultAzureCredential().get_token() SYNCHRONOUSLY, blocking
+                    # the asyncio event loop for 90-100 seconds.
+                    # We set it to empty string so that even if Foundry injects a
+                    # value, our explicit definition takes precedence and the empty
+                    # string is falsy → tracing setup is skipped.
+                    "AZURE_AI_PROJECT_ENDPOINT": "",
+                    # Setting APPLICATIONINSIGHTS_CONNECTION_STRING to a non-empty
+                    # sentinel prevents the agentserver logger from calling
+                    # AIProjectClient.telemetry.get_application_insights_connection_string()
+                    # (a blocking HTTPS call that can hang for 60-120 seconds).
+                    # The string "skip-telemetry" is not a valid connection string,
+                    # so the Application Insights exporter creation will fail
+                    # harmlessly and telemetry will be disabled.
+                    "APPLICATIONINSIGHTS_CONNECTION_STRING": "skip-telemetry",
+                    "AZURE_OPENAI_DEPLOYMENT": MODEL_NAME,
+                    "AZURE_OPENAI_API_VERSION": os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview"),
+                    "AGENT_DEBUG_ERRORS": "true",  # expose full errors in responses
+                    "SKIP_SCRAPING": "true",  # outbound internet blocked in Foundry container
+                },
+            ),
+        )
+        print(f"✅ Agent registered: {agent.name}  version={agent.version}  id={agent.id}")
+
+        if stop_future is not None:
+            stop_future.result()
+
+        print("Starting agent deployment (min_replicas=1 to prevent cold starts)...")
+        # Use REST API directly so we can pass min_replicas=1 — the az CLI does not
+        # expose this parameter and defaults to 0 (scale-to-zero), which causes the
+        # container to cold-start on every first request and time out Foundry's 30s
+        # deadline.
+        start_url = _container_url(agent.version, "start")
+        try:
+            resp = http.post(start_url, json={"min_replicas": 1})
+            if not resp.is_success:
+                raise RuntimeError(f"HTTP {resp.status_code} {resp.text.strip()}")
+            resp_data = resp.json()
+            container = resp_data.get("container", {})
+            print(f"✅ Agent deployment started: status={resp_data.get('status')}  "
+                  f"min_replicas={container.get('min_replicas')}  "
+                  f"max_replicas={container.get('max_replicas')}")
+        except Exception as exc:
+            print(f"⚠️  Start request failed: {exc}")
+            print(f"Run manually (min_replicas=1 body):")
+            print(f"  POST {start_url}")
+            print(f'  Body: {{"min_replicas": 1}}')
+            return
+
+    if warmup:
+        print("Sending warm-up request...")
+        _warm_agent(client, agent.version)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--image", required=True, help="Full ACR image URL, e.g. paritybotreg.azurecr.io/parity-bot:latest")
+    parser.add_argument("--no-warmup", action="store_true", help="Skip the warm-up request after the agent starts.")
+    parser.add_argument("--profile", action="store_true", help="Profile the deploy with pyinstrument and write an HTML report.")
     args = parser.parse_args()
-    deploy(args.image)
+    if args.profile:
+        run_profiled(lambda: deploy(args.image, warmup=not args.no_warmup), "deploy_agent_profile.html")
+    else:
+        deploy(args.image, warmup=not args.no_warmup)
@@ -18,11 +18,14 @@ from __future__ import annotations
 
 import argparse
 import os
+import shutil
 import subprocess
 import sys
 
 from dotenv import load_dotenv
 
+from hosted_agent_env import SHARED_ENV, run_profiled
+
 load_dotenv(override=True)
 
 PROJECT_ENDPOINT = os.getenv(
@@ -32,6 +35,22 @@ PROJECT_ENDPOINT = os.getenv(
 DIAG_AGENT_NAME = "azure-cloud-parity-diag"
 
 
+def _agent_cmd(action: str, version: object) -> list[str]:
+    """argv for `az cognitiveservices agent <action>` on a diag agent version.
+
+    az is resolved to its full path (az.cmd on Windows) so it can run without
+    a shell.
+    """
+    return [
+        shutil.which("az") or "az",
+        "cognitiveservices", "agent", action,
+        "--account-name", "cloudparitybotproject-resource",
+        "--project-name", "cloudparitybotproject",
+        "--name", DIAG_AGENT_NAME,
+        "--agent-version", str(version),
+    ]
+
+
 def deploy(image: str) -> None:
     from azure.ai.projects import AIProjectClient
     from azure.ai.projects.models import (
@@ -51,14 +70,12 @@ def deploy(image: str) -> None:
         next_version = current_version + 1
         print(f"Existing diag agent at v{current_version} → will create v{next_version}.")
 
-        stop_cmd = (
-            f"az cognitiveservices agent stop"
-            f" --account-name cloudparitybotproject-resource"
-            f" --project-name cloudparitybotproject"
-            f" --name {DIAG_AGENT_NAME}"
-            f" --agent-version {current_version}"
+        result = subprocess.run(
+            _agent_cmd("stop", current_version),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
         )
-        result = subprocess.run(stop_cmd, shell=True, capture_output=True, text=True)
         if result.returncode == 0:
             print(f"Stopped v{current_version}.")
         else:
@@ -80,39 +97,30 @@ def deploy(image: str) -> None:
             environment_variables={
                 # Forward the same env vars as the real bot so the checks are
                 # representative of what the real bot would see.
-                "AZURE_OPENAI_ENDPOINT":      "https://cloudparitybotproject-resource.services.ai.azure.com/",
+                **SHARED_ENV,
                 "AZURE_OPENAI_DEPLOYMENT":    "gpt-4o",
                 "AZURE_OPENAI_API_VERSION":   "2024-12-01-preview",
-                "FAST_AZURE_OPENAI_DEPLOYMENT": "gpt-4o-mini",
-                "AGENT_PROJECT_RESOURCE_ID": (
-                    "/subscriptions/0cc114af-43d6-4d8f-ba1d-cd863a819339"
-                    "/resourceGroups/Team2"
-                    "/providers/Microsoft.CognitiveServices/accounts"
-                    "/cloudparitybotproject-resource"
-                ),
             },
         ),
     )
     print(f"✅ Registered: {agent.name}  version={agent.version}")
 
-    start_cmd = (
-        f"az cognitiveservices agent start"
-        f" --account-name cloudparitybotproject-resource"
-        f" --project-name cloudparitybotproject"
-        f" --name {DIAG_AGENT_NAME}"
-        f" --agent-version {agent.version}"
-    )
-    result = subprocess.run(start_cmd, shell=True, capture_output=True, text=True)
+    start_cmd = _agent_cmd("start", agent.version)
+    result = subprocess.run(start_cmd, capture_output=True, text=True)
     if result.returncode == 0:
         print("✅ Diag agent started successfully.")
         print(result.stdout)
     else:
         print(f"⚠️  Start failed: {result.stderr}")
-        print(f"Run manually:\n  {start_cmd}")
+        print(f"Run manually:\n  {subprocess.list2cmdline(start_cmd)}")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--image", required=True, help="Full ACR image URL")
+    parser.add_argument("--profile", action="store_true", help="Profile the deploy with pyinstrument and write an HTML report.")
     args = parser.parse_args()
-    deploy(args.image)
+    if args.profile:
+        run_profiled(lambda: deploy(args.image), "deploy_diag_agent_profile.html")
+    else:
+        deploy(args.image)
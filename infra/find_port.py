@@ -1,19 +1,29 @@
-import os, azure.ai.agentserver.core.server as srv_pkg, inspect
+import os, re, azure.ai.agentserver.core.server as srv_pkg, inspect
 
 srv_dir = os.path.dirname(inspect.getfile(srv_pkg))
 print("server dir:", srv_dir)
 port_tokens = ["8080", "8088", "8087", "port=", "PORT", ":port"]
+# One case-insensitive pass over each file's bytes instead of a per-line,
+# per-token substring scan in Python
+port_re = re.compile("|".join(map(re.escape, port_tokens)).encode(), re.IGNORECASE)
 for root, dirs, files in os.walk(srv_dir):
     for fn in files:
         if not fn.endswith(".py"):
             continue
         path = os.path.join(root, fn)
         try:
-            lines = open(path, errors="replace").readlines()
+            with open(path, "rb") as f:
+                data = f.read()
         except Exception:
             continue
-        for i, line in enumerate(lines):
-            low = line.lower()
-            if any(t.lower() in low for t in port_tokens):
-                rel = os.path.relpath(path, srv_dir)
-                print(f"  {rel}:{i+1}: {line.rstrip()}")
+        line_no, counted_to, last_line_start = 1, 0, -1
+        for m in port_re.finditer(data):
+            start = data.rfind(b"\n", 0, m.start()) + 1
+            if start == last_line_start:
+                continue  # several tokens on one line – report it once
+            line_no += data.count(b"\n", counted_to, start)
+            counted_to = last_line_start = start
+            end = data.find(b"\n", m.end())
+            line = (data[start:] if end == -1 else data[start:end]).decode(errors="replace")
+            rel = os.path.relpath(path, srv_dir)
+            print(f"  {rel}:{line_no}: {line.rstrip()}")
@@ -0,0 +1,42 @@
+"""
+hosted_agent_env.py – Container environment and helpers shared by the hosted-agent deploy scripts.
+
+deploy_agent.py and deploy_diag_agent.py merge these values with their own
+per-agent settings, so the diagnostic agent always sees the same OpenAI and
+project-resource configuration as the real bot.
+"""
+from __future__ import annotations
+
+import sys
+from types import MappingProxyType
+from typing import Callable, Mapping
+
+SHARED_ENV: Mapping[str, str] = MappingProxyType({
+    # Use services.ai.azure.com endpoint – reachable from Foundry container networking.
+    "AZURE_OPENAI_ENDPOINT": "https://cloudparitybotproject-resource.services.ai.azure.com/",
+    "FAST_AZURE_OPENAI_DEPLOYMENT": "gpt-4o-mini",
+    # Required by the Agent Framework to resolve the project resource.
+    "AGENT_PROJECT_RESOURCE_ID": (
+        "/subscriptions/0cc114af-43d6-4d8f-ba1d-cd863a819339"
+        "/resourceGroups/Team2"
+        "/providers/Microsoft.CognitiveServices/accounts"
+        "/cloudparitybotproject-resource"
+    ),
+})
+
+
+def run_profiled(fn: Callable[[], None], out_path: str) -> None:
+    """Run `fn` under pyinstrument and write the HTML report to `out_path` (also on failure)."""
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        sys.exit("--profile needs pyinstrument: pip install pyinstrument")
+    profiler = Profiler()
+    profiler.start()
+    try:
+        fn()
+    finally:
+        profiler.stop()
+        with open(out_path, "w", encoding="utf-8") as f:
+            f.write(profiler.output_html())
+        print(f"Profile written to {out_path}")
@@ -91,17 +91,45 @@ def _configure_logging() -> None:
     logger.remove()
     # Use stdout so logs appear in the container log stream (Foundry captures stdout).
     # colorize=False: avoid ANSI escape codes that corrupt non-TTY output.
+    # enqueue=True: records are handed to a writer thread, so logging from the
+    # request path never blocks the event loop on formatting or I/O.
+    # diagnose/backtrace=False: skip loguru's frame-walking exception formatter
+    # (it also prints local variable values, which can include secrets).
     logger.add(
         sys.stdout,
         level=settings.log_level,
         colorize=False,
         format="{time:HH:mm:ss} | {level: <8} | {message}",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
     if settings.log_file:
-        import pathlib
+        os.makedirs(os.path.dirname(settings.log_file) or ".", exist_ok=True)
+        logger.add(
+            settings.log_file,
+            level=settings.log_level,
+            rotation="10 MB",
+            retention="7 days",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
+        )
+
 
-        pathlib.Path(settings.log_file).parent.mkdir(parents=True, exist_ok=True)
-        logger.add(settings.log_file, level=settings.log_level, rotation="10 MB", retention="7 days")
+def _loop_factory():
+    """Return uvloop's loop constructor when it is installed, else None (stdlib loop).
+
+    Passed to asyncio.Runner directly rather than installed as a global event
+    loop policy – the policy API is deprecated on newer Pythons.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not installed — using the default asyncio event loop.")
+        return None
+    logger.info(f"Event loop: uvloop {uvloop.__version__}")
+    return uvloop.new_event_loop
 
 
 async def _run_cli(query: str) -> None:
@@ -116,32 +144,22 @@ async def _run_cli(query: str) -> None:
         )
     ]
     logger.info(f"Running CLI pipeline with query: {query!r}")
-    response = await agent.run(messages)
-    for msg in response.messages:
-        if msg.role == Role.ASSISTANT:
-            for part in msg.contents or []:
-                if hasattr(part, "text"):
-                    print(part.text)
-
-
-async def _warm_credentials() -> None:
-    """Acquire an Azure token before accepting traffic to avoid first-request latency.
-
-    DefaultAzureCredential probes multiple credential types in a container
-    (EnvironmentCredential, WorkloadIdentity, ManagedIdentity, etc.).  The
-    first probe can take 1-5 s.  Doing it before the server starts serving
-    keeps that cost off the 30s Foundry request deadline.
-    """
-    from config.settings import settings
-    if not settings.azure_openai_endpoint:
-        return
     try:
-        from azure.identity import DefaultAzureCredential
-        cred = DefaultAzureCredential()
-        tok = cred.get_token("https://cognitiveservices.azure.com/.default")
-        logger.info(f"Credential warm-up OK (token expires {tok.expires_on}).")
-    except Exception as exc:  # non-fatal — will retry on first request
-        logger.warning(f"Credential warm-up failed (will retry on first request): {exc}")
+        response = await agent.run(messages)
+    finally:
+        from clients._http import close_shared_client
+
+        await close_shared_client()
+    chunks = [
+        part.text
+        for msg in response.messages
+        if msg.role == Role.ASSISTANT
+        for part in msg.contents or []
+        if hasattr(part, "text")
+    ]
+    if chunks:
+        sys.stdout.write("\n".join(chunks) + "\n")
+        sys.stdout.flush()
 
 
 async def _run_server() -> None:
@@ -156,7 +174,7 @@ async def _run_server() -> None:
     Foundry polls before routing traffic.
     """
     from azure.ai.agentserver.agentframework import from_agent_framework
-    from agents.feature_extractor import warm_feature_extractor_credential
+    from agents.feature_extractor import warm_feature_extractor_credential, warm_openai_connection
 
     # Build the WorkflowAgent ONCE at startup — DefaultAzureCredential init
     # inside FeatureExtractorAgent / ReportGeneratorAgent takes ~600ms each.
@@ -166,26 +184,35 @@ async def _run_server() -> None:
 
     def _checkpoint(msg: str) -> None:
         """Write to both streams so we see it regardless of container log capture."""
-        ts = f"[STARTUP {_time.time()-_t0:.2f}s]"
+        ts = f"[STARTUP {_time.monotonic()-_t0:.2f}s]"
         line = f"{ts} {msg}\n"
         sys.stdout.write(line); sys.stdout.flush()
         sys.stderr.write(line); sys.stderr.flush()
 
-    _t0 = _time.time()
-    _checkpoint("build_parity_agent starting")
-    _agent = build_parity_agent()
-    _checkpoint(f"build_parity_agent done in {_time.time()-_t0:.2f}s")
+    _t0 = _time.monotonic()
     # Warm the credential singleton shared by FeatureExtractorAgent and
     # ReportGeneratorAgent so the managed-identity token is cached before the
     # first request, keeping startup cost off the 30s Foundry deadline.
-    _checkpoint("warming Azure credentials (timeout 10s)")
-    _t1 = _time.time()
+    # The token fetch runs in a worker thread, so it overlaps with the agent
+    # build below; sleep(0) lets the task start that thread first.  The TLS
+    # connection to Azure OpenAI is opened alongside it.
+    _checkpoint("warming Azure credentials + OpenAI connection in the background (timeout 10s)")
+    warm_task = asyncio.gather(warm_feature_extractor_credential(), warm_openai_connection())
+    await asyncio.sleep(0)
+    # build_parity_agent() stays on the loop thread – it schedules the HTTP
+    # pre-connect task on the running loop.
+    _checkpoint("build_parity_agent starting")
+    _agent = build_parity_agent()
+    _checkpoint(f"build_parity_agent done in {_time.monotonic()-_t0:.2f}s")
     try:
-        await asyncio.wait_for(warm_feature_extractor_credential(), timeout=10.0)
+        await asyncio.wait_for(warm_task, timeout=max(0.0, 10.0 - (_time.monotonic() - _t0)))
     except asyncio.TimeoutError:
-        logger.warning("warm_feature_extractor_credential timed out after 10s — uvicorn will start anyway, retry on first request")
-    _checkpoint(f"credential warm-up done in {_time.time()-_t1:.2f}s")
-    _checkpoint(f"total pre-server init: {_time.time()-_t0:.2f}s — starting uvicorn")
+        logger.warning(
+            f"Credential + OpenAI connection warm-up timed out at {_time.monotonic()-_t0:.2f}s "
+            "(10s budget shared with build_parity_agent) — uvicorn will start anyway, retry on first request"
+        )
+    _checkpoint(f"credential + connection warm-up done at {_time.monotonic()-_t0:.2f}s")
+    _checkpoint(f"total pre-server init: {_time.monotonic()-_t0:.2f}s — starting uvicorn")
     await from_agent_framework(_agent).run_async()
 
 
@@ -207,10 +234,11 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    if args.cli:
-        asyncio.run(_run_cli(args.query))
-    else:
-        asyncio.run(_run_server())
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        if args.cli:
+            runner.run(_run_cli(args.query))
+        else:
+            runner.run(_run_server())
 
 
 if __name__ == "__main__":
@@ -59,14 +59,11 @@ class FeatureRecord(BaseModel):
 
     def is_parity_gap(self, baseline: CloudEnvironment = CloudEnvironment.COMMERCIAL) -> bool:
         """Returns True if any non-baseline environment lacks a feature available in baseline."""
-        baseline_status = self.get_status(baseline)
-        if baseline_status != FeatureStatus.GA:
+        status = self.status
+        if status.get(baseline) != FeatureStatus.GA:
             return False
-        return any(
-            self.get_status(env) == FeatureStatus.NOT_AVAILABLE
-            for env in CloudEnvironment
-            if env != baseline
-        )
+        # Missing environments count as UNKNOWN, so only stored entries can be gaps
+        return any(s == FeatureStatus.NOT_AVAILABLE and env != baseline for env, s in status.items())
 
 
 class FeatureComparison(BaseModel):
@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
-import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+import orjson
 from loguru import logger
+from pydantic import TypeAdapter
 
 from config.settings import settings
 from models.feature import CloudEnvironment, FeatureRecord, FeatureStatus, ParityReport
 
+# Validates a whole category file in one pydantic-core call, straight from bytes
+_RECORDS_ADAPTER = TypeAdapter(List[FeatureRecord])
+
+
+def _dump_json(path: Path, payload: Any) -> None:
+    """Write a JSON-compatible payload (as from model_dump(mode="json")) to `path`."""
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+
 
 class FeatureStore:
     """
@@ -30,13 +39,19 @@ class FeatureStore:
         self._data_dir.mkdir(parents=True, exist_ok=True)
         self._reports_dir.mkdir(parents=True, exist_ok=True)
         self._cache: Dict[str, FeatureRecord] = {}
+        # file key (see _file_key) → {feature id → record}, kept in step with _cache
+        self._by_category: Dict[str, Dict[str, FeatureRecord]] = {}
         self._load_all()
 
     # ── Internal helpers ──────────────────────────────────────────────────────
 
-    def _feature_file(self, category: str) -> Path:
-        safe = category.lower().replace(" ", "_").replace("/", "_")
-        return self._data_dir / f"{safe}.json"
+    @staticmethod
+    def _file_key(category: str) -> str:
+        """File stem for `category`; names differing only in case, spaces or '/' share a file."""
+        return category.lower().replace(" ", "_").replace("/", "_")
+
+    def _feature_file(self, key: str) -> Path:
+        return self._data_dir / f"{key}.json"
 
     def _load_all(self) -> None:
         """Load all feature JSON files into memory cache."""
@@ -44,36 +59,50 @@ class FeatureStore:
             if path.name.startswith("_"):
                 continue
             try:
-                with open(path, "r", encoding="utf-8") as fh:
-                    records = json.load(fh)
-                for raw in records:
-                    record = FeatureRecord(**raw)
-                    self._cache[record.id] = record
+                for record in _RECORDS_ADAPTER.validate_json(path.read_bytes()):
+                    self._put(record)
             except Exception as exc:
                 logger.warning(f"Failed to load {path}: {exc}")
         logger.info(f"Loaded {len(self._cache)} feature records from disk.")
 
-    def _save_category(self, category: str) -> None:
-        """Persist all records for a given category to disk."""
-        records = [r for r in self._cache.values() if r.category == category]
-        path = self._feature_file(category)
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump([r.model_dump(mode="json") for r in records], fh, indent=2, default=str)
+    def _put(self, record: FeatureRecord) -> Optional[str]:
+        """Cache `record`; return the file key it moved out of, if any."""
+        key = self._file_key(record.category)
+        previous = self._cache.get(record.id)
+        moved_from = None
+        if previous is not None:
+            previous_key = self._file_key(previous.category)
+            if previous_key != key:
+                moved_from = previous_key
+                self._by_category.get(previous_key, {}).pop(record.id, None)
+        self._cache[record.id] = record
+        self._by_category.setdefault(key, {})[record.id] = record
+        return moved_from
+
+    def _save_category(self, key: str) -> None:
+        """Persist every record stored in the file for `key` to disk."""
+        payload = [r.model_dump(mode="json") for r in self._by_category.get(key, {}).values()]
+        _dump_json(self._feature_file(key), payload)
 
     # ── Public API ────────────────────────────────────────────────────────────
 
     def upsert(self, record: FeatureRecord) -> None:
         """Insert or update a feature record."""
         record.last_updated = datetime.utcnow()
-        self._cache[record.id] = record
-        self._save_category(record.category)
+        moved_from = self._put(record)
+        self._save_category(self._file_key(record.category))
+        if moved_from is not None:
+            self._save_category(moved_from)
 
     def upsert_many(self, records: List[FeatureRecord]) -> None:
         categories = set()
+        now = datetime.utcnow()  # one timestamp for the whole batch
         for record in records:
-            record.last_updated = datetime.utcnow()
-            self._cache[record.id] = record
-            categories.add(record.category)
+            record.last_updated = now
+            moved_from = self._put(record)
+            categories.add(self._file_key(record.category))
+            if moved_from is not None:
+                categories.add(moved_from)
         for cat in categories:
             self._save_category(cat)
         logger.info(f"Upserted {len(records)} records across {len(categories)} categories.")
@@ -81,11 +110,17 @@ class FeatureStore:
     def get(self, feature_id: str) -> Optional[FeatureRecord]:
         return self._cache.get(feature_id)
 
+    def get_many(self, feature_ids: Iterable[str]) -> List[Optional[FeatureRecord]]:
+        """Look up several IDs at once; missing IDs yield None in their slot."""
+        cache = self._cache
+        return [cache.get(fid) for fid in feature_ids]
+
     def get_all(self) -> List[FeatureRecord]:
         return list(self._cache.values())
 
     def get_by_category(self, category: str) -> List[FeatureRecord]:
-        return [r for r in self._cache.values() if r.category.lower() == category.lower()]
+        """Return the records stored under `category`'s file (case-insensitive)."""
+        return list(self._by_category.get(self._file_key(category), {}).values())
 
     def get_parity_gaps(
         self,
@@ -100,8 +135,7 @@ class FeatureStore:
             ts = report.generated_at.strftime("%Y%m%d_%H%M%S")
             filename = f"parity_report_{ts}.json"
         path = self._reports_dir / filename
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(report.model_dump(mode="json"), fh, indent=2, default=str)
+        _dump_json(path, report.model_dump(mode="json"))
         logger.info(f"Report saved to {path}")
         return path
 
@@ -110,5 +144,4 @@ class FeatureStore:
         reports = sorted(self._reports_dir.glob("parity_report_*.json"), reverse=True)
         if not reports:
             return None
-        with open(reports[0], "r", encoding="utf-8") as fh:
-            return ParityReport(**json.load(fh))
+        return ParityReport.model_validate_json(reports[0].read_bytes())
@@ -3,46 +3,64 @@
 from __future__ import annotations
 
 import re
-from typing import Iterator, List, TypeVar
+from typing import Iterable, Iterator, List, TypeVar
 
 from models.feature import FeatureStatus
 
 T = TypeVar("T")
 
+_NON_SLUG_RE = re.compile(r"[^a-z0-9\s\-]")
+_SEPARATOR_RUN_RE = re.compile(r"[\s\-]+")
+
 
 def normalize_feature_name(name: str) -> str:
     """Convert a raw feature name to a URL-safe slug ID."""
     name = name.lower().strip()
-    name = re.sub(r"[^a-z0-9\s\-]", "", name)
-    name = re.sub(r"[\s\-]+", "-", name)
+    name = _NON_SLUG_RE.sub("", name)
+    name = _SEPARATOR_RUN_RE.sub("-", name)
     return name.strip("-")
 
 
+def _any_of(patterns: Iterable[str]) -> "re.Pattern[str]":
+    """Compile `patterns` into one regex matching any of them as a substring."""
+    return re.compile("|".join(re.escape(p) for p in sorted(patterns, key=len, reverse=True)))
+
+
+_GA_PATTERNS = frozenset({"ga", "generally available", "available", "yes", "✓", "✔", "supported"})
+_PREVIEW_PATTERNS = frozenset({"preview", "public preview", "private preview", "in preview", "beta"})
+_UNAVAILABLE_PATTERNS = frozenset(
+    {"no", "not available", "unavailable", "not supported", "n/a", "–", "-", "✗", "✘"}
+)
+
+# Whole-cell matches – most table cells are exactly one of the patterns
+_EXACT_STATUS = {
+    **{p: FeatureStatus.GA for p in _GA_PATTERNS},
+    **{p: FeatureStatus.PREVIEW for p in _PREVIEW_PATTERNS},
+    **{p: FeatureStatus.NOT_AVAILABLE for p in _UNAVAILABLE_PATTERNS},
+}
+
+# Negations contain GA substrings ("available", "supported"), so they are
+# matched first – otherwise "Not available*" or "unavailable¹" would read as GA
+_NEGATED_PATTERNS = frozenset({"not available", "unavailable", "not supported"})
+
+# Substring fallback, checked in this order – the first status with a match wins
+_STATUS_PATTERNS = (
+    (FeatureStatus.NOT_AVAILABLE, _any_of(_NEGATED_PATTERNS)),
+    (FeatureStatus.GA, _any_of(_GA_PATTERNS)),
+    (FeatureStatus.PREVIEW, _any_of(_PREVIEW_PATTERNS)),
+    (FeatureStatus.NOT_AVAILABLE, _any_of(_UNAVAILABLE_PATTERNS)),
+)
+
+
 def parse_status_string(raw: str) -> FeatureStatus:
     """Map raw text from documentation to a FeatureStatus enum value."""
     normalized = raw.strip().lower()
-
-    ga_patterns = {"ga", "generally available", "available", "yes", "✓", "✔", "supported"}
-    preview_patterns = {"preview", "public preview", "private preview", "in preview", "beta"}
-    unavailable_patterns = {
-        "no",
-        "not available",
-        "unavailable",
-        "not supported",
-        "n/a",
-        "–",
-        "-",
-        "✗",
-        "✘",
-    }
-
-    if normalized in ga_patterns or any(p in normalized for p in ga_patterns):
-        return FeatureStatus.GA
-    if any(p in normalized for p in preview_patterns):
-        return FeatureStatus.PREVIEW
-    if normalized in unavailable_patterns or any(p in normalized for p in unavailable_patterns):
-        return FeatureStatus.NOT_AVAILABLE
-
+    exact = _EXACT_STATUS.get(normalized)
+    if exact is not None:
+        return exact
+    for status, pattern in _STATUS_PATTERNS:
+        if pattern.search(normalized):
+            return status
     return FeatureStatus.UNKNOWN
 
 